@@ -0,0 +1,26 @@
+-- Adds the primary key used by the loader's INSERT ... ON CONFLICT to tables
+-- created before it was part of init-db.sql. Safe to run more than once.
+BEGIN;
+
+-- Keep a single row per (latitude, longitude, snapshot_time)
+DELETE FROM bronze_data.weather_history_forecast AS a
+USING bronze_data.weather_history_forecast AS b
+WHERE a.ctid < b.ctid
+  AND a.latitude = b.latitude
+  AND a.longitude = b.longitude
+  AND a.snapshot_time = b.snapshot_time;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_constraint
+        WHERE conrelid = 'bronze_data.weather_history_forecast'::regclass
+          AND contype = 'p'
+    ) THEN
+        ALTER TABLE bronze_data.weather_history_forecast
+            ADD PRIMARY KEY (latitude, longitude, snapshot_time);
+    END IF;
+END $$;
+
+COMMIT;
@@ -5,5 +5,6 @@ CREATE TABLE IF NOT EXISTS bronze_data.weather_history_forecast (
     latitude DECIMAL(9, 6) NOT NULL,
     longitude DECIMAL(9, 6) NOT NULL,
     temperature DOUBLE PRECISION NOT NULL,
-    wind_speed DOUBLE PRECISION NOT NULL
+    wind_speed DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (latitude, longitude, snapshot_time)
 );
@@ -0,0 +1,66 @@
+import datetime
+import unittest
+
+import pyarrow as pa
+
+from main import WEATHER_SCHEMA, build_upsert_query
+
+PK_COLS = ["latitude", "longitude", "snapshot_time"]
+
+
+class TestBuildUpsertQuery(unittest.TestCase):
+    def test_build_upsert_query(self):
+        # Input data
+        utc = datetime.timezone.utc
+        table = pa.Table.from_pydict({
+            "snapshot_time": [
+                datetime.datetime(2024, 11, 22, 10, tzinfo=utc),
+                datetime.datetime(2024, 11, 22, 11, tzinfo=utc),
+            ],
+            "latitude": [40.7128, 40.7128],
+            "longitude": [-74.006, -74.006],
+            "temperature": [21.5, None],
+            "wind_speed": [5.2, 4.8],
+        }, schema=WEATHER_SCHEMA)
+
+        query, rows = build_upsert_query(
+            table, "weather_history_forecast", "bronze_data", PK_COLS)
+
+        # Assert the query inserts every column and only updates the non-key ones
+        self.assertIn(
+            "INSERT INTO bronze_data.weather_history_forecast "
+            "(snapshot_time, latitude, longitude, temperature, wind_speed)",
+            query)
+        self.assertIn("ON CONFLICT (latitude, longitude, snapshot_time)", query)
+        self.assertIn(
+            "SET temperature = EXCLUDED.temperature, wind_speed = EXCLUDED.wind_speed",
+            query)
+
+        # Assert the rows hold naive UTC timestamps and keep nulls as None
+        expected = [
+            (datetime.datetime(2024, 11, 22, 10), 40.7128, -74.006, 21.5, 5.2),
+            (datetime.datetime(2024, 11, 22, 11), 40.7128, -74.006, None, 4.8),
+        ]
+        self.assertEqual(rows, expected)
+        self.assertIsNone(rows[0][0].tzinfo)
+
+    def test_build_upsert_query_drops_repeated_keys(self):
+        # The same location listed twice returns the same intervals twice
+        utc = datetime.timezone.utc
+        snapshot_time = datetime.datetime(2024, 11, 22, 10, tzinfo=utc)
+        table = pa.Table.from_pydict({
+            "snapshot_time": [snapshot_time, snapshot_time],
+            "latitude": [40.7128, 40.7128],
+            "longitude": [-74.006, -74.006],
+            "temperature": [21.5, 22.0],
+            "wind_speed": [5.2, 4.8],
+        }, schema=WEATHER_SCHEMA)
+
+        _, rows = build_upsert_query(
+            table, "weather_history_forecast", "bronze_data", PK_COLS)
+
+        # Assert only the last row for the key is kept
+        expected = [
+            (datetime.datetime(2024, 11, 22, 10), 40.7128, -74.006, 22.0, 4.8),
+        ]
+        self.assertEqual(rows, expected)
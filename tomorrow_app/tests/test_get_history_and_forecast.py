@@ -0,0 +1,85 @@
+import datetime
+import unittest
+from unittest import mock
+
+import orjson
+
+import main
+from main import WEATHER_SCHEMA, get_history_and_forecast
+
+
+def mock_response(intervals):
+    response = mock.Mock()
+    response.content = orjson.dumps(
+        {"data": {"timelines": [{"intervals": intervals}]}})
+    return response
+
+
+class TestGetHistoryAndForecast(unittest.TestCase):
+    def test_no_locations(self):
+        # No locations means no API calls and an empty, typed table
+        result = get_history_and_forecast("api_key", [])
+        self.assertEqual(result.num_rows, 0)
+        self.assertEqual(result.schema, WEATHER_SCHEMA)
+
+    def test_get_history_and_forecast(self):
+        # Input data
+        intervals = [
+            {
+                "startTime": "2024-11-22T10:00:00Z",
+                "values": {
+                    "temperature": 21.5,
+                    "windSpeed": 5.2
+                }
+            },
+            {
+                "startTime": "2024-11-22T11:00:00Z",
+                "values": {
+                    "temperature": 22.0,
+                    "windSpeed": 4.8
+                }
+            },
+        ]
+        locations = [{"lat": "25.8600", "lon": "-97.4200"}]
+
+        with mock.patch.object(main._SESSION, "get",
+                               return_value=mock_response(intervals)):
+            result = get_history_and_forecast("api_key", locations)
+
+        # Expected output
+        utc = datetime.timezone.utc
+        expected = {
+            "snapshot_time": [
+                datetime.datetime(2024, 11, 22, 10, tzinfo=utc),
+                datetime.datetime(2024, 11, 22, 11, tzinfo=utc),
+            ],
+            "latitude": [25.86, 25.86],
+            "longitude": [-97.42, -97.42],
+            "temperature": [21.5, 22.0],
+            "wind_speed": [5.2, 4.8],
+        }
+
+        # Assert the table has the expected schema and values
+        self.assertEqual(result.schema, WEATHER_SCHEMA)
+        self.assertEqual(result.to_pydict(), expected)
+
+    def test_missing_values_are_null(self):
+        # The API returns null for readings it does not have
+        intervals = [
+            {
+                "startTime": "2024-11-22T10:00:00Z",
+                "values": {
+                    "temperature": None,
+                    "windSpeed": 5.2
+                }
+            },
+        ]
+        locations = [{"lat": "25.8600", "lon": "-97.4200"}]
+
+        with mock.patch.object(main._SESSION, "get",
+                               return_value=mock_response(intervals)):
+            result = get_history_and_forecast("api_key", locations)
+
+        # Assert the missing reading is a null and not NaN
+        self.assertEqual(result["temperature"].to_pylist(), [None])
+        self.assertEqual(result["wind_speed"].to_pylist(), [5.2])
@@ -0,0 +1,52 @@
+import unittest
+
+from main import COLUMNS, transform_intervals, transform_row
+
+
+class TestTransformIntervals(unittest.TestCase):
+    def test_transform_intervals(self):
+        # Input data
+        intervals = [
+            {
+                "startTime": "2024-11-22T10:00:00Z",
+                "values": {
+                    "temperature": 21.5,
+                    "windSpeed": 5.2
+                }
+            },
+            {
+                "startTime": "2024-11-22T11:00:00Z",
+                "values": {
+                    "temperature": 22.0,
+                    "windSpeed": 4.8
+                }
+            },
+        ]
+        location = {
+            "lat": 40.7128,
+            "lon": -74.0060
+        }
+
+        # Expected output, one transformed row per interval
+        expected = [transform_row(interval, location) for interval in intervals]
+
+        # Assert the columns hold the same values as the transformed rows
+        result = transform_intervals(intervals, location)
+        self.assertEqual(set(result), set(COLUMNS))
+        for col in COLUMNS:
+            self.assertEqual(result[col].tolist(), [row[col] for row in expected])
+
+    def test_transform_intervals_casts_coordinates(self):
+        # locations.json stores the coordinates as strings
+        location = {
+            "lat": "25.8600",
+            "lon": "-97.4200"
+        }
+
+        result = transform_intervals(
+            [{"startTime": "2024-11-22T10:00:00Z",
+              "values": {"temperature": 21.5, "windSpeed": 5.2}}],
+            location,
+        )
+        self.assertEqual(result["latitude"].tolist(), [25.86])
+        self.assertEqual(result["longitude"].tolist(), [-97.42])